@@ -4,6 +4,7 @@ import importlib.metadata
 import json
 import logging
 import tomllib
+from collections import defaultdict
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Any, NoReturn
 
@@ -254,25 +255,28 @@ def calc(  # noqa: C901, PLR0912, PLR0915
     exit_as_err = False
     if verify:
         # Group verification results by scope
-        grouped_results: dict[str, list[tuple[str, bool, bool]]] = {}
-
-        for ppath, value in result.iter_leaf_values():
-            if isinstance(ppath.path, VerificationPath):
-                verification_name = ppath.path.verification_name
-                scope_name = ppath.scope
-                scope = project.scopes[scope_name]
+        grouped_results: defaultdict[str, list[tuple[str, bool, bool]]] = defaultdict(list)
+
+        # Only the verification trees are walked; model and calculation leaves are never visited
+        for scope_name, scope_tree in result.scopes.items():
+            scope = project.scopes[scope_name]
+            for verif_node in scope_tree.verifications:
+                verif_path = verif_node.path.path
+                if not isinstance(verif_path, VerificationPath):
+                    continue
+                verification_name = verif_path.verification_name
                 verification = scope.verifications[verification_name]
-                # Build display name WITHOUT scope prefix
-                display_name = f"?{verification_name}"
-                if ppath.path.parts:
-                    display_name += str(ppath.path)[len(f"?{verification_name}") :]
+                for leaf in verif_node.iter_leaves():
+                    ppath, value = leaf.path, leaf.value
+                    # Build display name WITHOUT scope prefix
+                    display_name = f"?{verification_name}"
+                    if ppath.path.parts:
+                        display_name += str(ppath.path)[len(f"?{verification_name}") :]
 
-                if scope_name not in grouped_results:
-                    grouped_results[scope_name] = []
-                grouped_results[scope_name].append((display_name, value, verification.xfail))
+                    grouped_results[scope_name].append((display_name, value, verification.xfail))
 
-                if (not value) ^ verification.xfail:
-                    exit_as_err = True
+                    if (not value) ^ verification.xfail:
+                        exit_as_err = True
 
         # Create a table for verification results grouped by scope
         if grouped_results:
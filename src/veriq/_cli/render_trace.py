@@ -16,6 +16,8 @@ from rich.tree import Tree
 from veriq._traceability import RequirementStatus
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from rich.console import Console
 
     from veriq._traceability import RequirementTraceEntry, TraceabilityReport
@@ -47,11 +49,16 @@ def _status_symbol(status: RequirementStatus) -> str:
             return "?"
 
 
+# Status cell markup, built once per status instead of once per table row
+_STATUS_TEXT: dict[RequirementStatus, str] = {
+    status: f"[{_status_style(status)}]{_status_symbol(status)} {status.upper()}[/{_status_style(status)}]"
+    for status in RequirementStatus
+}
+
+
 def _format_status(entry: RequirementTraceEntry) -> str:
     """Format status with color and symbol."""
-    style = _status_style(entry.status)
-    symbol = _status_symbol(entry.status)
-    status_text = f"[{style}]{symbol} {entry.status.upper()}[/{style}]"
+    status_text = _STATUS_TEXT[entry.status]
 
     if entry.xfail and entry.status == RequirementStatus.FAILED:
         status_text += " [yellow](expected)[/yellow]"
@@ -63,7 +70,7 @@ def _format_linked_verifications(entry: RequirementTraceEntry) -> str:
     """Format linked verification names for display (without results)."""
     if not entry.linked_verifications:
         return "[dim]-[/dim]"
-    return "\n".join(escape(name) for name in entry.linked_verifications)
+    return "\n".join([escape(name) for name in entry.linked_verifications])
 
 
 def _format_verification_results(entry: RequirementTraceEntry) -> str:
@@ -77,7 +84,7 @@ def _format_verification_results(entry: RequirementTraceEntry) -> str:
         name = f"{result.scope_name}::?{result.verification_name}"
         if result.table_key is not None:
             if isinstance(result.table_key, tuple):
-                key_str = ",".join(str(k) for k in result.table_key)
+                key_str = ",".join([str(k) for k in result.table_key])
             else:
                 key_str = str(result.table_key)
             name = f"{name}[{key_str}]"
@@ -92,59 +99,40 @@ def _format_verification_results(entry: RequirementTraceEntry) -> str:
 
 def _build_tree_prefixes(
     entries: tuple[RequirementTraceEntry, ...],
-    index: int,
-) -> tuple[str, str]:
-    """Build tree prefixes with unicode box-drawing characters.
+) -> list[tuple[str, str]]:
+    """Build tree prefixes with unicode box-drawing characters for all entries.
+
+    Entries are visited in reverse order, tracking for every depth level whether a
+    later sibling follows, so all prefixes are built in one pass.
 
     Args:
-        entries: All entries in the report.
-        index: Index of the current entry.
+        entries: All entries in the report, in depth-first order.
 
     Returns:
-        Tuple of (first_line_prefix, continuation_prefix).
+        List of (first_line_prefix, continuation_prefix), one per entry.
         First line uses ├── or └──, continuation uses │ or spaces.
 
     """
-    entry = entries[index]
-    if entry.depth == 0:
-        return "", ""
-
-    # Build prefix from left to right for each depth level
-    first_line_parts: list[str] = []
-    continuation_parts: list[str] = []
-
-    for level in range(1, entry.depth + 1):
-        if level == entry.depth:
-            # Current level: determine if this is the last sibling
-            is_last = True
-            for future_idx in range(index + 1, len(entries)):
-                future_entry = entries[future_idx]
-                if future_entry.depth < level:
-                    # Exited to a shallower level, so this was the last at this level
-                    break
-                if future_entry.depth == level:
-                    # Found another sibling at the same level
-                    is_last = False
-                    break
-            first_line_parts.append("└── " if is_last else "├── ")
-            # Continuation: if last sibling, use spaces; otherwise use vertical line
-            continuation_parts.append("    " if is_last else "│   ")
-        else:
-            # Ancestor level: check if there are more siblings at this level after current entry
-            has_more_at_level = False
-            for future_idx in range(index + 1, len(entries)):
-                future_entry = entries[future_idx]
-                if future_entry.depth < level:
-                    # Exited to shallower level
-                    break
-                if future_entry.depth == level:
-                    # Found a sibling at this ancestor level
-                    has_more_at_level = True
-                    break
-            first_line_parts.append("│   " if has_more_at_level else "    ")
-            continuation_parts.append("│   " if has_more_at_level else "    ")
-
-    return "".join(first_line_parts), "".join(continuation_parts)
+    prefixes: list[tuple[str, str]] = [("", "")] * len(entries)
+    # has_sibling_after[level]: the next entry at depth <= level (after the current one) is at that level
+    has_sibling_after: list[bool] = [False]
+
+    for index in range(len(entries) - 1, -1, -1):
+        depth = entries[index].depth
+        has_sibling_after.extend([False] * (depth + 1 - len(has_sibling_after)))
+        if depth > 0:
+            # Ancestor levels: vertical line if more siblings follow at that level
+            ancestors = "".join(["│   " if has_sibling_after[level] else "    " for level in range(1, depth)])
+            if has_sibling_after[depth]:
+                prefixes[index] = (ancestors + "├── ", ancestors + "│   ")
+            else:
+                prefixes[index] = (ancestors + "└── ", ancestors + "    ")
+
+        # This entry is now the next one for every level >= its depth
+        del has_sibling_after[depth + 1 :]
+        has_sibling_after[depth] = True
+
+    return prefixes
 
 
 def render_traceability_table(
@@ -175,9 +163,8 @@ def render_traceability_table(
         table.add_column("Status", no_wrap=True)
     table.add_column("Verifications", no_wrap=True)
 
-    for i, entry in enumerate(entries):
-        # Build tree prefixes with unicode symbols
-        first_prefix, cont_prefix = _build_tree_prefixes(entries, i)
+    # Build tree prefixes with unicode symbols
+    for entry, (first_prefix, cont_prefix) in zip(entries, _build_tree_prefixes(entries), strict=True):
 
         # Get verification content (may be multi-line)
         verif_content = (
@@ -276,11 +263,12 @@ def render_traceability_tree(
             label += " [yellow](expected)[/yellow]"
         nodes[entry.requirement_id] = Tree(label)
 
-    # Second pass: build hierarchy
+    # Second pass: build hierarchy, looking up child entries by ID (first entry wins)
+    entries_by_id = {entry.requirement_id: entry for entry in reversed(report.entries)}
     root_entries = [e for e in report.entries if e.depth == 0]
     for entry in root_entries:
         tree.add(nodes[entry.requirement_id])
-        _add_children_to_tree(entry, nodes, report.entries)
+        _add_children_to_tree(entry, nodes, entries_by_id)
 
     console.print(tree)
 
@@ -288,14 +276,13 @@ def render_traceability_tree(
 def _add_children_to_tree(
     parent_entry: RequirementTraceEntry,
     nodes: dict[str, Tree],
-    all_entries: tuple[RequirementTraceEntry, ...],
+    entries_by_id: Mapping[str, RequirementTraceEntry],
 ) -> None:
     """Recursively add children to tree nodes."""
     for child_id in parent_entry.child_ids:
         if child_id in nodes:
             nodes[parent_entry.requirement_id].add(nodes[child_id])
             # Find child entry and recurse
-            for entry in all_entries:
-                if entry.requirement_id == child_id:
-                    _add_children_to_tree(entry, nodes, all_entries)
-                    break
+            child_entry = entries_by_id.get(child_id)
+            if child_entry is not None:
+                _add_children_to_tree(child_entry, nodes, entries_by_id)
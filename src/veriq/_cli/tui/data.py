@@ -150,6 +150,51 @@ class TableData:
         key_str = self._serialize_key(full_key)
         return self.flat_data.get(key_str)
 
+    def get_slice_matrix(self, fixed_dims: Mapping[int, StrEnum]) -> list[list[Any]]:
+        """Get all cell values of the grid view in a single pass.
+
+        Equivalent to calling `get_cell` for every row/column label pair,
+        but resolves the row and column dimensions only once.
+
+        Args:
+            fixed_dims: Fixed dimension values for slicing
+
+        Returns:
+            Cell values as a list of rows, ordered like `row_labels` and `column_labels`.
+
+        """
+        row_labels = self.row_labels(fixed_dims)
+        col_labels = self.column_labels(fixed_dims)
+        get = self.flat_data.get
+
+        if self.dimensions == 1:
+            return [[get(row_label)] for row_label in row_labels]
+
+        free_dims = [i for i in range(self.dimensions) if i not in fixed_dims]
+        if len(free_dims) < 2:
+            return [
+                [self.get_cell(fixed_dims, row_label, col_label) for col_label in col_labels]
+                for row_label in row_labels
+            ]
+
+        row_dim, col_dim = free_dims[-2], free_dims[-1]
+
+        # Key template: fixed values stay in place, row/column labels fill their slots
+        slots = [i for i in range(self.dimensions) if i in fixed_dims or i in (row_dim, col_dim)]
+        template = [fixed_dims[i].value if i in fixed_dims else "" for i in slots]
+        row_pos = slots.index(row_dim)
+        col_pos = slots.index(col_dim)
+
+        matrix: list[list[Any]] = []
+        for row_label in row_labels:
+            template[row_pos] = row_label
+            row: list[Any] = []
+            for col_label in col_labels:
+                template[col_pos] = col_label
+                row.append(get(",".join(template)))
+            matrix.append(row)
+        return matrix
+
     def _build_full_key(
         self,
         fixed_dims: Mapping[int, StrEnum],
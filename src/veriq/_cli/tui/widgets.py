@@ -12,6 +12,7 @@ from textual.widgets import DataTable, Input, Label, Select, Static
 from textual.widgets._select import NoSelection
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from enum import StrEnum
 
     from textual.app import ComposeResult
@@ -116,6 +117,22 @@ class InlineCellInput(Input):
         self.post_message(self.EditCancelled())
 
 
+def _format_float_cell(value: Any) -> str:
+    """Format a cell of a float-valued table."""
+    if value is None:
+        return ""
+    if type(value) is not float:  # e.g. integers written as such in the TOML file
+        return str(value)
+    if value.is_integer():
+        return str(int(value))
+    return f"{value:.6g}"
+
+
+def _format_plain_cell(value: Any) -> str:
+    """Format a cell of an int-, str- or bool-valued table."""
+    return "" if value is None else str(value)
+
+
 class TableEditor(DataTable):
     """DataTable subclass with cell editing support for veriq Tables."""
 
@@ -140,6 +157,11 @@ class TableEditor(DataTable):
         self.fixed_dims: dict[int, StrEnum] = {}
         self._row_labels: list[str] = []
         self._col_labels: list[str] = []
+        # Label -> grid index lookups (column indices include the label column offset)
+        self._row_idx: dict[str, int] = {}
+        self._col_idx: dict[str, int] = {}
+        # Cell formatter specialised for the loaded table's value type
+        self._fmt: Callable[[Any], str] = self._format_value
         # Inline editing state
         self._editing: bool = False
         self._edit_coordinate: Coordinate | None = None
@@ -171,19 +193,26 @@ class TableEditor(DataTable):
         # Get labels
         self._row_labels = table_data.row_labels(self.fixed_dims)
         self._col_labels = table_data.column_labels(self.fixed_dims)
+        self._row_idx = {row_label: i for i, row_label in enumerate(self._row_labels)}
+        self._col_idx = {col_label: i for i, col_label in enumerate(self._col_labels, start=1)}
+        self._fmt = self._make_formatter(table_data.value_type)
 
         # Add columns (first column is for row labels)
         self.add_column("", key="__label__")
         for col_label in self._col_labels:
             self.add_column(col_label, key=col_label)
 
-        # Add rows
-        for row_label in self._row_labels:
-            row_values: list[str] = [row_label]
-            for col_label in self._col_labels:
-                value = table_data.get_cell(self.fixed_dims, row_label, col_label)
-                row_values.append(self._format_value(value))
-            self.add_row(*row_values, key=row_label)
+        # Format the whole slice in one pass
+        cells = self._format_slice(table_data.get_slice_matrix(self.fixed_dims))
+
+        # Add keyed rows one at a time (`add_rows` cannot assign row keys)
+        for row_label, row_cells in zip(self._row_labels, cells, strict=True):
+            self.add_row(row_label, *row_cells, key=row_label)
+
+    def _format_slice(self, matrix: list[list[Any]]) -> list[list[str]]:
+        """Format a whole slice of cell values for display in one pass."""
+        fmt = self._fmt
+        return [list(map(fmt, row)) for row in matrix]
 
     def _format_value(self, value: Any) -> str:
         """Format a cell value for display."""
@@ -191,15 +220,51 @@ class TableEditor(DataTable):
             return ""
         if isinstance(value, float):
             # Format floats with reasonable precision
-            if value == int(value):
+            if value.is_integer():
                 return str(int(value))
             return f"{value:.6g}"
         return str(value)
 
+    def _make_formatter(self, value_type: type) -> Callable[[Any], str]:
+        """Choose the cell formatter for a table's value type once, at load time.
+
+        Args:
+            value_type: The value type of the table
+
+        Returns:
+            A callable formatting a single cell value for display
+
+        """
+        if value_type is float:
+            return _format_float_cell
+        if value_type in (int, str, bool):
+            return _format_plain_cell
+        return self._format_value
+
     def update_slice(self, fixed_dims: dict[int, StrEnum]) -> None:
-        """Update the display for a new slice (when dimension selector changes)."""
-        if self.table_data is not None:
-            self.load_table(self.table_data, fixed_dims)
+        """Update the display for a new slice (when dimension selector changes).
+
+        Slices of the same table usually share their row and column labels.
+        In that case only the cell values are rewritten in place; otherwise
+        the grid is rebuilt with `load_table`.
+        """
+        table_data = self.table_data
+        if table_data is None:
+            return
+
+        if (
+            fixed_dims.keys() != self.fixed_dims.keys()
+            or table_data.row_labels(fixed_dims) != self._row_labels
+            or table_data.column_labels(fixed_dims) != self._col_labels
+        ):
+            self.load_table(table_data, fixed_dims)
+            return
+
+        self.fixed_dims = dict(fixed_dims)
+        cells = self._format_slice(table_data.get_slice_matrix(self.fixed_dims))
+        for row_idx, row_cells in enumerate(cells):
+            for col_idx, cell in enumerate(row_cells, start=1):  # Column 0 holds the row labels
+                self.update_cell_at(Coordinate(row_idx, col_idx), cell, update_width=True)
 
     def on_data_table_cell_selected(self, event: DataTable.CellSelected) -> None:
         """Handle cell selection - start inline edit for non-label cells."""
@@ -256,7 +321,7 @@ class TableEditor(DataTable):
         self._edit_col_label = col_label
 
         # Update the cell to show the input value directly
-        formatted = self._format_value(current_value)
+        formatted = self._fmt(current_value)
         self.update_cell_at(coordinate, f"[bold cyan]{formatted}[/]")
 
         # Reuse existing input widget or create a new one
@@ -285,7 +350,7 @@ class TableEditor(DataTable):
         )
         self.update_cell_at(
             self._edit_coordinate,
-            self._format_value(original_value),
+            self._fmt(original_value),
         )
 
     def cancel_inline_edit(self) -> None:
@@ -407,15 +472,13 @@ class TableEditor(DataTable):
         self.table_data.update_cell(self.fixed_dims, row_label, col_label, new_value)
 
         # Update the display
-        try:
-            row_idx = self._row_labels.index(row_label)
-            col_idx = self._col_labels.index(col_label) + 1  # Adjust for label column
+        row_idx = self._row_idx.get(row_label)
+        col_idx = self._col_idx.get(col_label)
+        if row_idx is not None and col_idx is not None:
             self.update_cell_at(
                 Coordinate(row_idx, col_idx),
-                self._format_value(new_value),
+                self._fmt(new_value),
             )
-        except (ValueError, IndexError):
-            pass
 
         # Post message about the update
         self.post_message(self.CellValueUpdated(row_label, col_label, new_value))
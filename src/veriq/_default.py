@@ -10,13 +10,17 @@ The default value of a type `T` will be determined as follows:
 
 from __future__ import annotations
 
+import inspect
 from annotationlib import ForwardRef
 from enum import Enum
+from functools import lru_cache
 from itertools import product
 from typing import TYPE_CHECKING, Any, Final, get_args, get_origin
 
 from pydantic import BaseModel
 
+from ._table import Table
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
@@ -60,8 +64,6 @@ def _default_table(type_: Any) -> Any:
     - Table[Mode, int] → Table({Mode.A: 0, Mode.B: 0})
     - Table[tuple[Mode, Phase], int] → Table({(m, p): 0 for m in Mode for p in Phase})
     """
-    from veriq._table import Table  # noqa: PLC0415
-
     args = get_args(type_)
     if len(args) != 2:
         msg = f"Table requires exactly 2 type arguments, got {len(args)}"
@@ -111,29 +113,47 @@ def default[T](type_: type[T]) -> T:
         return _default_tuple(type_)  # ty: ignore[invalid-return-type]
 
     # Handle Table types (generic like Table[Mode, int])
-    if origin is not None:
-        # Import Table here to avoid circular dependency
-        from veriq._table import Table  # noqa: PLC0415
+    if origin is Table:
+        return _default_table(type_)
+
+    # Classes: the custom-default / predefined-type dispatch is resolved once per class
+    if isinstance(type_, type):
+        default_impl = _resolve_class_default_impl(type_)
+        if default_impl is None:
+            msg = f"No default value defined for type {type_}"
+            raise ValueError(msg)
+        return default_impl(type_)  # ty: ignore[invalid-return-type] # We ensure key-value consistency in `DEFAULT_IMPL`
+
+    # Non-class annotations (e.g. `Annotated[...]`) may still forward a custom default method
+    if hasattr(type_, "default"):
+        return _call_custom_default(type_)
 
-        if origin is Table:
-            return _default_table(type_)
+    msg = f"No default value defined for type {type_}"
+    raise ValueError(msg)
+
+
+def _call_custom_default(type_: Any) -> Any:
+    try:
+        return type_.default()
+    except TypeError as e:
+        msg = f"Failed to call default method of type {type_}. Make sure it is a class method with no arguments."
+        raise TypeError(msg) from e
+
+
+_MISSING: Final = object()
 
-    # Handle types with custom default method
-    if hasattr(type_, "default"):
-        try:
-            return type_.default()  # ty: ignore[call-non-callable] # It will be handled by the try-except
-        except TypeError as e:
-            msg = f"Failed to call default method of type {type_}. Make sure it is a class method with no arguments."
-            raise TypeError(msg) from e
 
-    # Handle predefined types via issubclass check
+# Bounded so that dynamically created classes (`create_model`, per-test classes) can still be collected
+@lru_cache(maxsize=1024)
+def _resolve_class_default_impl(type_: type) -> Callable[[Any], object] | None:
+    """Find how to build the default value of a class, or `None` if there is no way to."""
+    # Types with custom default method. `getattr_static` finds it without triggering descriptors.
+    if inspect.getattr_static(type_, "default", _MISSING) is not _MISSING:
+        return _call_custom_default
+
+    # Predefined types via issubclass check
     for super_cls, default_impl in DEFAULT_IMPL.items():
-        try:
-            if issubclass(type_, super_cls):
-                return default_impl(type_)  # ty: ignore[invalid-return-type] # We ensure key-value consistency in `DEFAULT_IMPL`
-        except TypeError:
-            # issubclass() raises TypeError for non-class types
-            continue
+        if issubclass(type_, super_cls):
+            return default_impl
 
-    msg = f"No default value defined for type {type_}"
-    raise ValueError(msg)
+    return None
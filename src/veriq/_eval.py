@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Any
 
 from ._eval_engine import EvaluationResult, evaluate_graph
 from ._ir import build_graph_spec
-from ._path import ModelPath, ProjectPath, get_value_by_parts, iter_leaf_path_parts
+from ._path import ModelPath, ProjectPath, get_value_by_parts, leaf_path_parts
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -51,17 +51,18 @@ def evaluate_project(project: Project, model_data: Mapping[str, BaseModel]) -> E
     initial_values: dict[ProjectPath, Any] = {}
     for scope_name, scope_data in model_data.items():
         root_model = project.scopes[scope_name].get_root_model()
-        for leaf_path_parts in iter_leaf_path_parts(root_model):
+        for leaf_parts in leaf_path_parts(root_model):
             leaf_path = ProjectPath(
                 scope=scope_name,
-                path=ModelPath(root="$", parts=leaf_path_parts),
+                path=ModelPath(root="$", parts=leaf_parts),
             )
-            value = get_value_by_parts(scope_data, leaf_path_parts)
+            value = get_value_by_parts(scope_data, leaf_parts)
             initial_values[leaf_path] = value
 
-    logger.debug("Initial values from model data:")
-    for ppath, value in initial_values.items():
-        logger.debug("  %s: %r", ppath, value)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Initial values from model data:")
+        for ppath, value in initial_values.items():
+            logger.debug("  %s: %r", ppath, value)
 
     # Build graph spec and evaluate
     graph_spec = build_graph_spec(project)
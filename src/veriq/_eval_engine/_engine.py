@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -14,16 +16,17 @@ from veriq._path import (
     ProjectPath,
     VerificationPath,
     get_value_by_parts,
-    iter_leaf_path_parts,
+    leaf_path_parts,
 )
 
-from ._resolution import hydrate_inputs
+from ._resolution import InputSource, hydrate_from_sources, hydrate_inputs, resolve_input_sources
 from ._tree import PathNode, ScopeTree, build_scope_trees
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
 
-    from veriq._ir import GraphSpec
+    from veriq._ir import GraphSpec, NodeSpec
+    from veriq._path import PartBase
 
 logger = logging.getLogger(__name__)
 
@@ -126,9 +129,8 @@ class EvaluationResult:
 
         """
         for scope_tree in self.scopes.values():
-            for node in scope_tree.iter_all_nodes():
-                for leaf in node.iter_leaves():
-                    yield leaf.path, leaf.value
+            for leaf in scope_tree.iter_leaves():
+                yield leaf.path, leaf.value
 
     def has_value(self, path: ProjectPath) -> bool:
         """Check if a value exists at the given path.
@@ -161,19 +163,18 @@ class EvaluationResult:
         return self.validity.get(path, True)
 
 
-def _get_function_key(path: ProjectPath) -> str:
+def _get_function_key(path: ProjectPath) -> tuple[str, str]:
     """Get a unique key for the function associated with a path.
 
     Multiple leaf paths may share the same underlying function.
     This key identifies the function so we only call it once.
     """
-    return f"{path.scope}::{path.path.root}"
+    return (path.scope, path.path.root)
 
 
-def _check_validity(  # noqa: C901, PLR0912
-    graph_spec: GraphSpec,
+def _check_validity(  # noqa: C901
+    plan: _CompiledPlan,
     values: dict[ProjectPath, Any],
-    eval_order: list[ProjectPath],
 ) -> dict[ProjectPath, bool]:
     """Check validity based on assumed verifications.
 
@@ -185,9 +186,8 @@ def _check_validity(  # noqa: C901, PLR0912
     values are overridden to False to ensure consistent behavior for all API users.
 
     Args:
-        graph_spec: The specification of nodes and their dependencies.
+        plan: The compiled plan of the evaluated graph.
         values: The computed values dict (will be modified in place for invalid verifications).
-        eval_order: The topological order of evaluation.
 
     Returns:
         Dictionary mapping paths to validity status (True = valid).
@@ -195,55 +195,36 @@ def _check_validity(  # noqa: C901, PLR0912
     """
     validity: dict[ProjectPath, bool] = dict.fromkeys(values, True)
 
-    # First pass: Check direct assumptions
-    # Group nodes by function key to handle multiple leaf paths from same function
-    func_assumptions: dict[str, list[ProjectPath]] = {}
-    func_nodes: dict[str, list[ProjectPath]] = {}
-
-    for path, spec in graph_spec.nodes.items():
-        if spec.kind in (NodeKind.CALCULATION, NodeKind.VERIFICATION):
-            func_key = _get_function_key(path)
-            func_nodes.setdefault(func_key, []).append(path)
-            assumed_paths = spec.metadata.get("assumed_verification_paths", [])
-            if assumed_paths and func_key not in func_assumptions:
-                func_assumptions[func_key] = assumed_paths
+    # Index the computed values by (scope, root) to find all leaves of a verification
+    root_index: dict[tuple[str, str], list[ProjectPath]] = {}
+    if plan.assumptions:
+        for p in values:
+            root_index.setdefault((p.scope, p.path.root), []).append(p)
 
-    # Mark nodes invalid if their assumed verifications failed
-    for func_key, assumed_paths in func_assumptions.items():
+    # First pass: Mark nodes invalid if their assumed verifications failed
+    for assumed_paths, output_paths in plan.assumptions:
         assumption_holds = True
         for assumed_path in assumed_paths:
             # Check ALL leaf paths of the verification (for Table[K, bool])
             # The assumed_path is the root verification path, we need to find all leaves
-            verif_results = [
-                values.get(p)
-                for p in values
-                if p.scope == assumed_path.scope and p.path.root == assumed_path.path.root
-            ]
+            verif_results = [values[p] for p in root_index.get((assumed_path.scope, assumed_path.path.root), ())]
             # Assumption holds only if ALL verification results are True
             if not all(v is True for v in verif_results if v is not None):
                 assumption_holds = False
                 break
 
         if not assumption_holds:
-            for output_path in func_nodes.get(func_key, []):
+            for output_path in output_paths:
                 validity[output_path] = False
 
-    # Second pass: Propagate invalidity through dependencies (in topological order)
-    for path in eval_order:
-        if path not in validity:
-            continue
-        if not validity[path]:
-            continue  # Already invalid
-
-        spec = graph_spec.nodes.get(path)
-        if spec is None:
-            continue
-
-        # Check if any dependency is invalid
-        for dep_path in spec.dependencies:
-            if not validity.get(dep_path, True):
-                validity[path] = False
-                break
+    # Second pass: Propagate invalidity to everything downstream of an invalid node
+    queue = deque(path for path, is_valid in validity.items() if not is_valid)
+    while queue:
+        path = queue.popleft()
+        for dependent in plan.successors.get(path, ()):
+            if validity.get(dependent) is True:
+                validity[dependent] = False
+                queue.append(dependent)
 
     # Override invalid verification values to False
     # This ensures consistent behavior for both Python API and CLI users
@@ -270,9 +251,238 @@ def _make_output_leaf_path(
     return ProjectPath(scope=base_path.scope, path=leaf_path)
 
 
+@dataclass(frozen=True, slots=True)
+class _Step:
+    """Precomputed work for one node of the evaluation order.
+
+    Attributes:
+        node_path: The node to evaluate.
+        spec: The node's spec, or None if the graph has no spec for it.
+        outputs: `(leaf_path, leaf_parts)` pairs to split the function result into.
+            Empty for nodes that are not evaluated by a compute function.
+        sources: Resolved leaf sources of the function parameters. None if they
+            could not be resolved ahead of evaluation.
+        required: All leaf paths read by `sources`, to check for missing values up front.
+
+    """
+
+    node_path: ProjectPath
+    spec: NodeSpec | None
+    outputs: tuple[tuple[ProjectPath, tuple[PartBase, ...]], ...]
+    sources: dict[str, InputSource] | None = None
+    required: tuple[ProjectPath, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledPlan:
+    """Evaluation schedule derived from a GraphSpec, independent of the input values.
+
+    Attributes:
+        eval_order: Topological order of the nodes that take part in a dependency edge.
+        inputs: Steps for the nodes of `eval_order` not computed by a function
+            (MODEL nodes and nodes without spec or compute function). Their values
+            must be given as initial values.
+        steps: One representative step per compute function, in topological order.
+            Multiple leaf paths share the same underlying function, which only
+            needs to be called once.
+        levels: `steps` grouped into dependency levels. The functions of a level
+            only depend on inputs and on functions of earlier levels.
+        successors: Mapping from each node to the nodes that directly depend on it.
+        assumptions: For each function assuming verifications, the assumed
+            verification paths and the node paths of the function's outputs.
+        validation_errors: Errors found while validating/ordering the graph.
+            If not empty, the graph cannot be evaluated.
+
+    """
+
+    eval_order: list[ProjectPath] = field(default_factory=list)
+    inputs: tuple[_Step, ...] = ()
+    steps: tuple[_Step, ...] = ()
+    levels: tuple[tuple[_Step, ...], ...] = ()
+    successors: dict[ProjectPath, list[ProjectPath]] = field(default_factory=dict)
+    assumptions: tuple[tuple[tuple[ProjectPath, ...], tuple[ProjectPath, ...]], ...] = ()
+    validation_errors: tuple[str, ...] = ()
+
+
+def _compile_plan(graph_spec: GraphSpec) -> _CompiledPlan:
+    """Validate and order the graph, and precompute the per-node evaluation work."""
+    # Build the dependency graph from node specs
+    edges: list[tuple[ProjectPath, ProjectPath]] = []
+    successors: dict[ProjectPath, list[ProjectPath]] = {}
+    for node in graph_spec.nodes.values():
+        edges.extend((dep, node.id) for dep in node.dependencies)
+        for dep in node.dependencies:
+            successors.setdefault(dep, []).append(node.id)
+
+    graph = DependencyGraph.from_edges(edges)
+
+    # Validate the graph
+    validation_errors = graph.validate()
+    if validation_errors:
+        return _CompiledPlan(validation_errors=tuple(validation_errors))
+
+    # Get evaluation order
+    try:
+        eval_order = graph.topological_order()
+    except ValueError as e:
+        return _CompiledPlan(validation_errors=(str(e),))
+
+    # Share a single ProjectPath object per distinct path across the plan, so that the
+    # value table lookups made by a consumer hit the very key object its producer stored
+    canonical: dict[ProjectPath, ProjectPath] = {path: path for path in graph_spec.nodes}
+    intern = canonical.setdefault
+
+    inputs: list[_Step] = []
+    steps: list[_Step] = []
+    seen_functions: set[tuple[str, str]] = set()
+    for node_path in eval_order:
+        spec = graph_spec.nodes.get(node_path)
+        if spec is None or spec.kind == NodeKind.MODEL or spec.compute_fn is None:
+            inputs.append(_Step(node_path, spec, ()))
+            continue
+
+        # The first leaf path of a function in topological order represents it
+        func_key = _get_function_key(node_path)
+        if func_key in seen_functions:
+            continue
+        seen_functions.add(func_key)
+
+        # Use root_output_type from metadata to get the full output structure
+        root_output_type = spec.metadata.get("root_output_type", spec.output_type)
+        outputs = tuple(
+            (intern(_make_output_leaf_path(node_path, leaf_parts)), leaf_parts)
+            for leaf_parts in leaf_path_parts(root_output_type)
+        )
+        try:
+            input_sources = {
+                param_name: _intern_source(source, intern)
+                for param_name, source in resolve_input_sources(spec.param_mapping, graph_spec).items()
+            }
+        except KeyError:
+            # Reported as a missing dependency when the step is evaluated
+            steps.append(_Step(node_path, spec, outputs))
+            continue
+        required = tuple(
+            dict.fromkeys(leaf_ppath for source in input_sources.values() for _, leaf_ppath in source.leaves),
+        )
+        steps.append(_Step(node_path, spec, outputs, input_sources, required))
+
+    return _CompiledPlan(
+        eval_order=eval_order,
+        inputs=tuple(inputs),
+        steps=tuple(steps),
+        levels=_group_steps_by_level(steps),
+        successors=successors,
+        assumptions=_collect_assumptions(graph_spec),
+    )
+
+
+def _collect_assumptions(
+    graph_spec: GraphSpec,
+) -> tuple[tuple[tuple[ProjectPath, ...], tuple[ProjectPath, ...]], ...]:
+    """Collect the assumed verifications of each function, with the function's output nodes."""
+    # Group nodes by function key to handle multiple leaf paths from same function
+    func_assumptions: dict[tuple[str, str], list[ProjectPath]] = {}
+    func_nodes: dict[tuple[str, str], list[ProjectPath]] = {}
+
+    for path, spec in graph_spec.nodes.items():
+        if spec.kind in (NodeKind.CALCULATION, NodeKind.VERIFICATION):
+            func_key = _get_function_key(path)
+            func_nodes.setdefault(func_key, []).append(path)
+            assumed_paths = spec.metadata.get("assumed_verification_paths", [])
+            if assumed_paths and func_key not in func_assumptions:
+                func_assumptions[func_key] = assumed_paths
+
+    return tuple(
+        (tuple(assumed_paths), tuple(func_nodes[func_key])) for func_key, assumed_paths in func_assumptions.items()
+    )
+
+
+def _intern_source(source: InputSource, intern: Callable[[ProjectPath], ProjectPath]) -> InputSource:
+    """Replace the paths of an InputSource with their canonical objects."""
+    return InputSource(
+        dep_type=source.dep_type,
+        leaves=tuple((leaf_parts, intern(leaf_ppath)) for leaf_parts, leaf_ppath in source.leaves),
+        whole=None if source.whole is None else intern(source.whole),
+    )
+
+
+def _group_steps_by_level(steps: list[_Step]) -> tuple[tuple[_Step, ...], ...]:
+    """Group topologically ordered steps so that each step only depends on earlier levels."""
+    producer_level: dict[ProjectPath, int] = {}
+    levels: list[list[_Step]] = []
+    for step in steps:
+        assert step.spec is not None
+        level = 1 + max((producer_level.get(dep, -1) for dep in step.spec.dependencies), default=-1)
+        if level == len(levels):
+            levels.append([])
+        levels[level].append(step)
+        for leaf_ppath, _ in step.outputs:
+            producer_level[leaf_ppath] = level
+    return tuple(tuple(level) for level in levels)
+
+
+def _call_step(step: _Step, values: dict[ProjectPath, Any], graph_spec: GraphSpec) -> tuple[Any, str | None]:
+    """Hydrate the inputs of a step and call its function.
+
+    Returns:
+        `(result, None)` on success, or `(None, error_message)` on failure.
+
+    """
+    spec = step.spec
+    assert spec is not None
+    assert spec.compute_fn is not None
+
+    logger.debug("Evaluating %s", step.node_path)
+
+    # Hydrate inputs from leaf values
+    if step.sources is None:
+        try:
+            input_values = hydrate_inputs(spec.param_mapping, values, graph_spec)
+        except KeyError as e:
+            return None, f"Missing dependency value: {e}"
+    else:
+        missing = [leaf_ppath for leaf_ppath in step.required if leaf_ppath not in values]
+        if missing:
+            return None, f"Missing dependency value: {', '.join(str(leaf_ppath) for leaf_ppath in missing)}"
+        input_values = hydrate_from_sources(step.sources, values)
+
+    # Call the function
+    try:
+        result = spec.compute_fn(**input_values)
+    except (TypeError, ValueError, AttributeError, KeyError, RuntimeError) as e:
+        return None, f"Evaluation error: {e}"
+
+    logger.debug("Result for %s: %r", step.node_path, result)
+    return result, None
+
+
+def _record_outcome(
+    step: _Step,
+    outcome: tuple[Any, str | None],
+    values: dict[ProjectPath, Any],
+    errors: list[tuple[ProjectPath, str]],
+) -> None:
+    """Store the leaf values of a step's result, or its error."""
+    result, error = outcome
+    if error is not None:
+        errors.append((step.node_path, error))
+        return
+
+    # Decompose result into leaf values
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for leaf_ppath, leaf_parts in step.outputs:
+        leaf_value = get_value_by_parts(result, leaf_parts)
+        values[leaf_ppath] = leaf_value
+        if debug:
+            logger.debug("  Set %s = %r", leaf_ppath, leaf_value)
+
+
 def evaluate_graph(  # noqa: C901
     graph_spec: GraphSpec,
     initial_values: dict[ProjectPath, Any],
+    *,
+    max_workers: int = 1,
 ) -> EvaluationResult:
     """Evaluate the computation graph with given initial values.
 
@@ -282,13 +492,25 @@ def evaluate_graph(  # noqa: C901
     3. Computes topological order
     4. Evaluates each node in order, resolving dependencies from computed values
 
+    Steps 1-3 and the per-node bookkeeping do not depend on `initial_values`,
+    so they are compiled into a plan once, up front, and the evaluation loop
+    only walks that plan. The nodes and dependencies of `graph_spec` must not
+    be modified while it is being evaluated.
+
     Args:
         graph_spec: The specification of nodes and their dependencies.
         initial_values: Values for MODEL nodes (input data from TOML/etc).
+        max_workers: Number of threads used to call independent functions
+            concurrently. The default of 1 evaluates sequentially. Only
+            functions that release the GIL (I/O, native extensions) benefit
+            from more workers.
 
     Returns:
         EvaluationResult containing computed values and any errors.
 
+    Raises:
+        ValueError: If `max_workers` is less than 1.
+
     Example:
         >>> spec = build_graph_spec(project)
         >>> initial = {path: value for path, value in model_data}
@@ -297,19 +519,12 @@ def evaluate_graph(  # noqa: C901
         ...     print(result.values)
 
     """
-    # Build the dependency graph from node specs
-    edges: list[tuple[ProjectPath, ProjectPath]] = []
-    for node in graph_spec.nodes.values():
-        edges.extend((dep, node.id) for dep in node.dependencies)
+    if max_workers < 1:
+        msg = f"max_workers must be at least 1, got {max_workers}"
+        raise ValueError(msg)
 
-    graph = DependencyGraph.from_edges(edges)
-
-    # Add isolated nodes (MODEL nodes with no dependents may not have edges)
-    # We need to ensure all nodes are in the graph for proper ordering
-
-    # Validate the graph
-    validation_errors = graph.validate()
-    if validation_errors:
+    plan = _compile_plan(graph_spec)
+    if plan.validation_errors:
         return EvaluationResult(
             scopes={},
             errors=[
@@ -320,24 +535,7 @@ def evaluate_graph(  # noqa: C901
                     ),
                     err,
                 )
-                for err in validation_errors
-            ],
-        )
-
-    # Get evaluation order
-    try:
-        eval_order = graph.topological_order()
-    except ValueError as e:
-        return EvaluationResult(
-            scopes={},
-            errors=[
-                (
-                    ProjectPath(
-                        scope="__validation__",
-                        path=ModelPath(root="$", parts=()),
-                    ),
-                    str(e),
-                ),
+                for err in plan.validation_errors
             ],
         )
 
@@ -345,75 +543,39 @@ def evaluate_graph(  # noqa: C901
     values: dict[ProjectPath, Any] = dict(initial_values)
     errors: list[tuple[ProjectPath, str]] = []
 
-    # Track which functions have been evaluated
-    # (Multiple leaf paths share the same underlying function)
-    evaluated_functions: set[str] = set()
-
-    logger.debug("Starting evaluation with %d nodes in order", len(eval_order))
+    logger.debug("Starting evaluation with %d nodes in order", len(plan.eval_order))
 
-    for node_path in eval_order:
-        # Skip if already have value (MODEL node or already computed)
+    # Nodes that are not computed must have been given as initial values
+    for step in plan.inputs:
+        node_path = step.node_path
         if node_path in values:
-            logger.debug("Skipping %s (already has value)", node_path)
             continue
 
-        spec = graph_spec.nodes.get(node_path)
+        spec = step.spec
         if spec is None:
             errors.append((node_path, f"No spec found for node {node_path}"))
-            continue
-
-        if spec.kind == NodeKind.MODEL:
+        elif spec.kind == NodeKind.MODEL:
             errors.append((node_path, f"Missing initial value for model node {node_path}"))
-            continue
-
-        # For CALCULATION and VERIFICATION nodes
-        if spec.compute_fn is None:
+        else:
             errors.append((node_path, f"No compute function for node {node_path}"))
-            continue
-
-        # Check if we've already evaluated this function
-        func_key = _get_function_key(node_path)
-        if func_key in evaluated_functions:
-            # Value should already be computed by the first leaf path
-            continue
-
-        logger.debug("Evaluating %s", node_path)
-
-        # Hydrate inputs from leaf values
-        try:
-            input_values = hydrate_inputs(
-                spec.param_mapping,
-                values,
-                graph_spec,
-            )
-        except KeyError as e:
-            errors.append((node_path, f"Missing dependency value: {e}"))
-            continue
 
-        # Call the function
-        try:
-            result = spec.compute_fn(**input_values)
-        except (TypeError, ValueError, AttributeError, KeyError, RuntimeError) as e:
-            errors.append((node_path, f"Evaluation error: {e}"))
-            continue
-
-        logger.debug("Result for %s: %r", node_path, result)
-
-        # Decompose result into leaf values
-        # Use root_output_type from metadata to get the full output structure
-        root_output_type = spec.metadata.get("root_output_type", spec.output_type)
-        for leaf_parts in iter_leaf_path_parts(root_output_type):
-            leaf_ppath = _make_output_leaf_path(node_path, leaf_parts)
-            leaf_value = get_value_by_parts(result, leaf_parts)
-            values[leaf_ppath] = leaf_value
-            logger.debug("  Set %s = %r", leaf_ppath, leaf_value)
-
-        evaluated_functions.add(func_key)
+    # Call each CALCULATION and VERIFICATION function once, in topological order
+    if max_workers == 1:
+        for step in plan.steps:
+            _record_outcome(step, _call_step(step, values, graph_spec), values, errors)
+    else:
+        # Functions of the same level are independent: call them concurrently, then
+        # record their results from this thread before moving on to the next level
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for level in plan.levels:
+                outcomes = list(executor.map(lambda step: _call_step(step, values, graph_spec), level))
+                for step, outcome in zip(level, outcomes, strict=True):
+                    _record_outcome(step, outcome, values, errors)
 
     # Check validity based on assumed verifications
     # Note: _check_validity modifies values in place for invalid verifications
     # (invalid verifications are overridden to False)
-    validity = _check_validity(graph_spec, values, eval_order)
+    validity = _check_validity(plan, values)
 
     # Build tree structure from flat values
     scopes = build_scope_trees(values)
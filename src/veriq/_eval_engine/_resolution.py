@@ -1,35 +1,96 @@
 """Value resolution utilities for the evaluation engine."""
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from veriq._path import (
     CalcPath,
     ModelPath,
+    PartBase,
     ProjectPath,
     hydrate_value_by_leaf_values,
-    iter_leaf_path_parts,
+    leaf_path_parts,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from veriq._ir import GraphSpec
 
 
-def hydrate_inputs(
+@dataclass(frozen=True, slots=True)
+class InputSource:
+    """Where the value of a function parameter is read from.
+
+    Attributes:
+        dep_type: The type of the dependency, used to hydrate the full value.
+        leaves: `(leaf_parts, leaf_path)` pairs, one per leaf value of the dependency.
+        whole: Path of a leaf holding the complete value (scalars, Tables), if any.
+            The value is then read as is instead of being hydrated from `leaves`.
+
+    """
+
+    dep_type: type
+    leaves: tuple[tuple[tuple[PartBase, ...], ProjectPath], ...]
+    whole: ProjectPath | None = None
+
+
+def resolve_input_sources(
     param_mapping: dict[str, ProjectPath],
-    values: dict[ProjectPath, Any],
     graph_spec: GraphSpec,
-) -> dict[str, Any]:
-    """Hydrate function inputs from leaf values.
+) -> dict[str, InputSource]:
+    """Resolve the leaf paths to read each function parameter from.
 
-    Given a mapping from parameter names to their source ProjectPaths,
-    reconstruct the full objects from the leaf values stored in the
-    results dictionary.
+    This only depends on the graph, so it can be done once ahead of evaluation.
 
     Args:
         param_mapping: Maps function parameter names to source ProjectPaths.
-        values: Dictionary of computed leaf values.
         graph_spec: The GraphSpec for type information.
 
+    Returns:
+        Dictionary mapping parameter names to their InputSource.
+
+    Raises:
+        KeyError: If the type of a source path is unknown.
+
+    """
+    sources: dict[str, InputSource] = {}
+
+    for param_name, dep_ppath in param_mapping.items():
+        dep_path = dep_ppath.path
+        if isinstance(dep_path, CalcPath):
+            path_class: type[CalcPath | ModelPath] = CalcPath
+        elif isinstance(dep_path, ModelPath):
+            path_class = ModelPath
+        else:
+            msg = f"Unsupported path type: {type(dep_path)}"
+            raise TypeError(msg)
+
+        dep_type = graph_spec.get_type(dep_ppath)
+        scope, root, prefix = dep_ppath.scope, dep_path.root, dep_path.parts
+
+        leaves = [
+            (leaf_parts, ProjectPath(scope=scope, path=path_class(root=root, parts=prefix + leaf_parts)))
+            for leaf_parts in leaf_path_parts(dep_type)
+        ]
+
+        # `hydrate_value_by_leaf_values` returns the value at the empty path as is
+        whole = next((leaf_ppath for leaf_parts, leaf_ppath in leaves if leaf_parts == ()), None)
+        sources[param_name] = InputSource(dep_type=dep_type, leaves=tuple(leaves), whole=whole)
+
+    return sources
+
+
+def hydrate_from_sources(
+    sources: Mapping[str, InputSource],
+    values: dict[ProjectPath, Any],
+) -> dict[str, Any]:
+    """Hydrate function inputs from leaf values, given resolved input sources.
+
+    Args:
+        sources: Maps function parameter names to their resolved InputSource.
+        values: Dictionary of computed leaf values.
+
     Returns:
         Dictionary mapping parameter names to hydrated values.
 
@@ -39,32 +100,51 @@ def hydrate_inputs(
     """
     input_values: dict[str, Any] = {}
 
-    for param_name, dep_ppath in param_mapping.items():
-        dep_type = graph_spec.get_type(dep_ppath)
+    for param_name, source in sources.items():
+        if source.whole is not None:
+            try:
+                input_values[param_name] = values[source.whole]
+            except KeyError:
+                msg = f"Missing value for path: {source.whole}"
+                raise KeyError(msg) from None
+            continue
 
         # Collect leaf values for this dependency
         leaf_values: dict[tuple, Any] = {}
-        for leaf_parts in iter_leaf_path_parts(dep_type):
-            # Build the full leaf path
-            full_leaf_parts = dep_ppath.path.parts + leaf_parts
+        for leaf_parts, leaf_ppath in source.leaves:
+            try:
+                leaf_values[leaf_parts] = values[leaf_ppath]
+            except KeyError:
+                msg = f"Missing value for path: {leaf_ppath}"
+                raise KeyError(msg) from None
 
-            if isinstance(dep_ppath.path, CalcPath):
-                leaf_path = CalcPath(root=dep_ppath.path.root, parts=full_leaf_parts)
-            elif isinstance(dep_ppath.path, ModelPath):
-                leaf_path = ModelPath(root="$", parts=full_leaf_parts)
-            else:
-                msg = f"Unsupported path type: {type(dep_ppath.path)}"
-                raise TypeError(msg)
+        # Hydrate the full value from leaves
+        input_values[param_name] = hydrate_value_by_leaf_values(source.dep_type, leaf_values)
 
-            leaf_ppath = ProjectPath(scope=dep_ppath.scope, path=leaf_path)
+    return input_values
 
-            if leaf_ppath not in values:
-                msg = f"Missing value for path: {leaf_ppath}"
-                raise KeyError(msg)
 
-            leaf_values[leaf_parts] = values[leaf_ppath]
+def hydrate_inputs(
+    param_mapping: dict[str, ProjectPath],
+    values: dict[ProjectPath, Any],
+    graph_spec: GraphSpec,
+) -> dict[str, Any]:
+    """Hydrate function inputs from leaf values.
 
-        # Hydrate the full value from leaves
-        input_values[param_name] = hydrate_value_by_leaf_values(dep_type, leaf_values)
+    Given a mapping from parameter names to their source ProjectPaths,
+    reconstruct the full objects from the leaf values stored in the
+    results dictionary.
 
-    return input_values
+    Args:
+        param_mapping: Maps function parameter names to source ProjectPaths.
+        values: Dictionary of computed leaf values.
+        graph_spec: The GraphSpec for type information.
+
+    Returns:
+        Dictionary mapping parameter names to hydrated values.
+
+    Raises:
+        KeyError: If a required leaf value is missing.
+
+    """
+    return hydrate_from_sources(resolve_input_sources(param_mapping, graph_spec), values)
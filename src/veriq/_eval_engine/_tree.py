@@ -9,7 +9,9 @@ organized as trees of PathNodes grouped by scope. This enables:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 from veriq._path import (
@@ -44,6 +46,8 @@ class PathNode:
     path: ProjectPath
     value: Any | None = None
     children: tuple[PathNode, ...] = ()
+    # Children keyed by their last path part, built on the first `get_child` call
+    _child_index: dict[PartBase, PathNode] | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def is_leaf(self) -> bool:
@@ -57,11 +61,14 @@ class PathNode:
             PathNode instances that are leaves (have values, no children).
 
         """
-        if self.is_leaf:
-            yield self
-        else:
-            for child in self.children:
-                yield from child.iter_leaves()
+        # Explicit depth-first stack: nested generators would cost a frame per level
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.children:
+                stack.extend(reversed(node.children))
+            else:
+                yield node
 
     def get_child(self, part: PartBase) -> PathNode | None:
         """Get a direct child by its path part.
@@ -73,11 +80,13 @@ class PathNode:
             The matching child PathNode, or None if not found.
 
         """
-        for child in self.children:
-            child_parts = child.path.path.parts
-            if child_parts and child_parts[-1] == part:
-                return child
-        return None
+        child_index = self._child_index
+        if child_index is None:
+            child_index = {
+                child.path.path.parts[-1]: child for child in reversed(self.children) if child.path.path.parts
+            }
+            object.__setattr__(self, "_child_index", child_index)
+        return child_index.get(part)
 
 
 @dataclass(frozen=True, slots=True)
@@ -98,6 +107,21 @@ class ScopeTree:
     model: PathNode | None = None
     calculations: tuple[PathNode, ...] = ()
     verifications: tuple[PathNode, ...] = ()
+    # Lookup tables by name (the root without its '@' / '?' sigil), built once instead of scanning per lookup
+    _calculations_by_name: dict[str, PathNode] = field(init=False, repr=False, compare=False)
+    _verifications_by_name: dict[str, PathNode] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_calculations_by_name",
+            {calc.path.path.root[1:]: calc for calc in reversed(self.calculations)},
+        )
+        object.__setattr__(
+            self,
+            "_verifications_by_name",
+            {verif.path.path.root[1:]: verif for verif in reversed(self.verifications)},
+        )
 
     def get_calculation(self, name: str) -> PathNode | None:
         """Get a calculation tree by name.
@@ -109,11 +133,7 @@ class ScopeTree:
             The PathNode for the calculation, or None if not found.
 
         """
-        root = f"@{name}"
-        for calc in self.calculations:
-            if calc.path.path.root == root:
-                return calc
-        return None
+        return self._calculations_by_name.get(name)
 
     def get_verification(self, name: str) -> PathNode | None:
         """Get a verification tree by name.
@@ -125,11 +145,7 @@ class ScopeTree:
             The PathNode for the verification, or None if not found.
 
         """
-        root = f"?{name}"
-        for verif in self.verifications:
-            if verif.path.path.root == root:
-                return verif
-        return None
+        return self._verifications_by_name.get(name)
 
     def iter_all_nodes(self) -> Generator[PathNode]:
         """Iterate over all root path nodes in this scope.
@@ -143,18 +159,41 @@ class ScopeTree:
         yield from self.calculations
         yield from self.verifications
 
+    def iter_leaves(self) -> Generator[PathNode]:
+        """Iterate over all leaf nodes in this scope, in a single depth-first walk.
+
+        Yields:
+            Leaf PathNodes of the model, calculations, and verifications, in that order.
+
+        """
+        stack = [*reversed(self.verifications), *reversed(self.calculations)]
+        if self.model is not None:
+            stack.append(self.model)
+        while stack:
+            node = stack.pop()
+            if node.children:
+                stack.extend(reversed(node.children))
+            else:
+                yield node
+
 
 def _group_paths_by_root(
     paths_values: list[tuple[ProjectPath, Any]],
 ) -> dict[str, list[tuple[ProjectPath, Any]]]:
     """Group paths by their root (e.g., '$', '@calc_name', '?verify_name')."""
-    groups: dict[str, list[tuple[ProjectPath, Any]]] = {}
+    groups: defaultdict[str, list[tuple[ProjectPath, Any]]] = defaultdict(list)
     for ppath, value in paths_values:
-        root = ppath.path.root
-        if root not in groups:
-            groups[root] = []
-        groups[root].append((ppath, value))
-    return groups
+        groups[ppath.path.root].append((ppath, value))
+    return dict(groups)
+
+
+@dataclass(slots=True)
+class _OpenNode:
+    """A node of `_build_tree_from_paths` whose children are still being collected."""
+
+    parts: tuple[PartBase, ...]
+    value: Any | None = None
+    children: list[PathNode] = field(default_factory=list)
 
 
 def _build_tree_from_paths(
@@ -165,6 +204,10 @@ def _build_tree_from_paths(
 ) -> PathNode:
     """Build a tree structure from a list of paths with the same root.
 
+    The paths are sorted once by their parts so that every subtree occupies a
+    contiguous run of entries, and the tree is then assembled in a single pass
+    with an explicit stack holding the chain of open nodes from the root.
+
     Args:
         scope_name: The scope name for constructing ProjectPaths.
         root: The root string (e.g., '$', '@calc_name').
@@ -175,57 +218,49 @@ def _build_tree_from_paths(
         The root PathNode of the constructed tree.
 
     """
-    # Build a nested dict structure first for easier tree construction
-    # tree_data[parts] = value for leaf nodes
-    tree_data: dict[tuple[PartBase, ...], Any] = {}
-    for ppath, value in paths_values:
-        tree_data[ppath.path.parts] = value
-
-    def build_node(
-        current_parts: tuple[PartBase, ...],
-        remaining_keys: set[tuple[PartBase, ...]],
-    ) -> PathNode:
-        """Recursively build PathNode from parts."""
-        # Create the path for this node
-        path = path_class(root=root, parts=current_parts)
-        ppath = ProjectPath(scope=scope_name, path=path)
-
-        # Check if this is a leaf node (has a value directly)
-        if current_parts in tree_data and not any(
-            k != current_parts and len(k) > len(current_parts) and k[: len(current_parts)] == current_parts
-            for k in remaining_keys
-        ):
-            return PathNode(path=ppath, value=tree_data[current_parts])
-
-        # Find direct children (paths that extend current_parts by exactly one part)
-        direct_child_parts: set[PartBase] = set()
-        for parts in remaining_keys:
-            if len(parts) > len(current_parts) and parts[: len(current_parts)] == current_parts:
-                # This path extends current_parts
-                next_part = parts[len(current_parts)]
-                direct_child_parts.add(next_part)
-
-        if not direct_child_parts:
-            # No children, this must be a leaf
-            value = tree_data.get(current_parts)
-            return PathNode(path=ppath, value=value)
-
-        # Build children
-        children: list[PathNode] = []
-        for child_part in sorted(direct_child_parts, key=_part_sort_key):
-            child_parts = (*current_parts, child_part)
-            child_remaining = {k for k in remaining_keys if k[: len(child_parts)] == child_parts}
-            child_node = build_node(child_parts, child_remaining)
-            children.append(child_node)
-
-        # Intermediate node with children (value is None)
-        return PathNode(path=ppath, value=None, children=tuple(children))
-
-    return build_node((), set(tree_data.keys()))
-
-
+    if len(paths_values) == 1 and not paths_values[0][0].path.parts:
+        # A scalar result: the root itself is the only leaf
+        path = path_class(root=root, parts=())
+        return PathNode(path=ProjectPath(scope=scope_name, path=path), value=paths_values[0][1])
+
+    entries = sorted(
+        ((ppath.path.parts, value) for ppath, value in paths_values),
+        key=lambda entry: tuple(map(_part_sort_key, entry[0])),
+    )
+
+    def make_node(frame: _OpenNode) -> PathNode:
+        ppath = ProjectPath(scope=scope_name, path=path_class(root=root, parts=frame.parts))
+        if frame.children:
+            # Intermediate node with children (value is None)
+            return PathNode(path=ppath, value=None, children=tuple(frame.children))
+        return PathNode(path=ppath, value=frame.value)
+
+    # stack[i] is an ancestor of stack[i + 1]; stack[0] is the root node
+    stack: list[_OpenNode] = [_OpenNode(parts=())]
+    for parts, value in entries:
+        # Close the nodes whose subtree does not contain this entry
+        while parts[: len(stack[-1].parts)] != stack[-1].parts:
+            closed = stack.pop()
+            stack[-1].children.append(make_node(closed))
+        if parts == stack[-1].parts:
+            stack[-1].value = value
+            continue
+        # Open the intermediate nodes between the deepest open ancestor and this entry
+        stack.extend(_OpenNode(parts=parts[:depth]) for depth in range(len(stack[-1].parts) + 1, len(parts)))
+        stack.append(_OpenNode(parts=parts, value=value))
+
+    while len(stack) > 1:
+        closed = stack.pop()
+        stack[-1].children.append(make_node(closed))
+    return make_node(stack[0])
+
+
+@cache
 def _part_sort_key(part: PartBase) -> tuple[int, str]:
-    """Sort key for path parts (AttributePart before ItemPart, then by name/key)."""
+    """Sort key for path parts (AttributePart before ItemPart, then by name/key).
+
+    Memoized per part: the same parts recur across sibling paths and trees.
+    """
     if isinstance(part, AttributePart):
         return (0, part.name)
     if isinstance(part, ItemPart):
@@ -236,7 +271,19 @@ def _part_sort_key(part: PartBase) -> tuple[int, str]:
     return (2, str(part))
 
 
-def build_scope_trees(  # noqa: C901
+# Index of the list each path class is sorted into by `build_scope_trees`
+_PATH_BUCKETS: dict[type, int] = {ModelPath: 0, CalcPath: 1, VerificationPath: 2}
+
+
+def _subclass_bucket(path: object) -> int | None:
+    """Find the bucket of a path whose exact class is not in `_PATH_BUCKETS`."""
+    for path_class, bucket in _PATH_BUCKETS.items():
+        if isinstance(path, path_class):
+            return bucket
+    return None
+
+
+def build_scope_trees(
     values: dict[ProjectPath, Any],
 ) -> dict[str, ScopeTree]:
     """Build tree structure from flat values dict.
@@ -249,28 +296,23 @@ def build_scope_trees(  # noqa: C901
 
     """
     # Group by scope first
-    by_scope: dict[str, list[tuple[ProjectPath, Any]]] = {}
+    by_scope: defaultdict[str, list[tuple[ProjectPath, Any]]] = defaultdict(list)
     for ppath, value in values.items():
-        scope = ppath.scope
-        if scope not in by_scope:
-            by_scope[scope] = []
-        by_scope[scope].append((ppath, value))
+        by_scope[ppath.scope].append((ppath, value))
 
     result: dict[str, ScopeTree] = {}
 
     for scope_name, scope_paths in by_scope.items():
         # Separate by path type
-        model_paths: list[tuple[ProjectPath, Any]] = []
-        calc_paths: list[tuple[ProjectPath, Any]] = []
-        verif_paths: list[tuple[ProjectPath, Any]] = []
-
-        for ppath, value in scope_paths:
-            if isinstance(ppath.path, ModelPath):
-                model_paths.append((ppath, value))
-            elif isinstance(ppath.path, CalcPath):
-                calc_paths.append((ppath, value))
-            elif isinstance(ppath.path, VerificationPath):
-                verif_paths.append((ppath, value))
+        buckets: tuple[list[tuple[ProjectPath, Any]], ...] = ([], [], [])
+        for entry in scope_paths:
+            bucket = _PATH_BUCKETS.get(type(entry[0].path))
+            if bucket is None:
+                bucket = _subclass_bucket(entry[0].path)
+                if bucket is None:
+                    continue
+            buckets[bucket].append(entry)
+        model_paths, calc_paths, verif_paths = buckets
 
         # Build model tree
         model_node: PathNode | None = None
@@ -1,7 +1,7 @@
 """Graph algorithms for dependency graph operations."""
 
-from collections import defaultdict, deque
 from collections.abc import Collection, Hashable, Mapping
+from graphlib import CycleError, TopologicalSorter
 
 
 def topological_sort[T: Hashable](successors: Mapping[T, Collection[T]]) -> list[T]:
@@ -27,27 +27,15 @@ def topological_sort[T: Hashable](successors: Mapping[T, Collection[T]]) -> list
         ['a', 'b', 'c']
 
     """
-    # Calculate in-degree for each node
-    indegree: defaultdict[T, int] = defaultdict(int)
+    sorter: TopologicalSorter[T] = TopologicalSorter()
     for node, deps in successors.items():
-        indegree[node] = indegree.get(node, 0)
+        sorter.add(node)
         for dep in deps:
-            indegree[dep] += 1
-
-    # Start with nodes that have no predecessors (in-degree 0)
-    queue = deque([node for node, deg in indegree.items() if deg == 0])
-    order: list[T] = []
-
-    while queue:
-        node = queue.popleft()
-        order.append(node)
-        for successor in successors.get(node, []):
-            indegree[successor] -= 1
-            if indegree[successor] == 0:
-                queue.append(successor)
-
-    if len(order) != len(indegree):
-        msg = "Cycle detected in graph"
-        raise ValueError(msg)
-
-    return order
+            sorter.add(dep, node)
+
+    try:
+        return list(sorter.static_order())
+    except CycleError as e:
+        cycle = " -> ".join(str(node) for node in e.args[1])
+        msg = f"Cycle detected in graph: {cycle}"
+        raise ValueError(msg) from None
@@ -7,7 +7,7 @@ from veriq._path import (
     ModelPath,
     ProjectPath,
     VerificationPath,
-    iter_leaf_path_parts,
+    leaf_path_parts,
     parse_path,
 )
 
@@ -53,7 +53,7 @@ def _collect_input_leaf_paths(
 
     for dep_ppath in dep_ppaths.values():
         dep_type = project.get_type(dep_ppath)
-        for leaf_parts in iter_leaf_path_parts(dep_type):
+        for leaf_parts in leaf_path_parts(dep_type):
             # Build the full leaf path by appending leaf parts to the dependency path
             src_leaf_abs_parts = dep_ppath.path.parts + leaf_parts
 
@@ -103,7 +103,7 @@ def build_graph_spec(project: Project) -> GraphSpec:  # noqa: C901, PLR0912
     for scope_name, scope in project.scopes.items():
         # 1. Create MODEL nodes for root model leaf paths
         root_model = scope.get_root_model()
-        for leaf_parts in iter_leaf_path_parts(root_model):
+        for leaf_parts in leaf_path_parts(root_model):
             leaf_ppath = ProjectPath(
                 scope=scope_name,
                 path=ModelPath(root="$", parts=leaf_parts),
@@ -133,7 +133,7 @@ def build_graph_spec(project: Project) -> GraphSpec:  # noqa: C901, PLR0912
                     type_registry[dep_ppath] = project.get_type(dep_ppath)
 
             # Create a node for each output leaf path
-            for leaf_parts in iter_leaf_path_parts(calc.output_type):
+            for leaf_parts in leaf_path_parts(calc.output_type):
                 leaf_ppath = ProjectPath(
                     scope=scope_name,
                     path=CalcPath(root=f"@{calc_name}", parts=leaf_parts),
@@ -180,7 +180,7 @@ def build_graph_spec(project: Project) -> GraphSpec:  # noqa: C901, PLR0912
                     type_registry[dep_ppath] = project.get_type(dep_ppath)
 
             # Create a node for each output leaf path
-            for leaf_parts in iter_leaf_path_parts(verif.output_type):
+            for leaf_parts in leaf_path_parts(verif.output_type):
                 leaf_ppath = ProjectPath(
                     scope=scope_name,
                     path=VerificationPath(root=f"?{verif_name}", parts=leaf_parts),
@@ -21,6 +21,9 @@ class GraphSpec:
     - Transformed into a DependencyGraph for evaluation
     - (Future) Serialized/deserialized for caching
 
+    The `nodes` mapping is a plain dict, so immutability is by convention:
+    do not add, remove, or replace nodes once the spec has been built.
+
     Attributes:
         nodes: Mapping from node ID (ProjectPath) to NodeSpec.
         scope_names: Tuple of scope names in the graph.
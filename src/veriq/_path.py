@@ -1,7 +1,9 @@
 import logging
+import sys
 from annotationlib import ForwardRef
 from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import cache, lru_cache
 from inspect import isclass
 from itertools import product
 from typing import TYPE_CHECKING, Any, ClassVar, Self, get_args, get_origin
@@ -17,6 +19,12 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _intern(s: str) -> str:
+    # Path roots and scope names are compared and hashed in every value table lookup;
+    # interning them makes equal strings identical. `sys.intern` only accepts exact `str`.
+    return sys.intern(s) if type(s) is str else s
+
+
 class PartBase:
     pass
 
@@ -31,26 +39,28 @@ class ItemPart(PartBase):
     key: str | tuple[str, ...]
 
 
+@cache
+def _format_part(part: PartBase) -> str:
+    # Memoized: sibling paths repeat the same parts, and paths are stringified for every displayed value
+    match part:
+        case AttributePart(name):
+            return f".{name}"
+        case ItemPart(key):
+            if isinstance(key, tuple):
+                return f"[{','.join(key)}]"
+            return f"[{key}]"
+        case _:
+            msg = f"Unknown part type: {type(part)}"
+            raise TypeError(msg)
+
+
 @dataclass(slots=True, frozen=True)
 class Path:
     root: str
     parts: tuple[PartBase, ...]
 
     def __str__(self) -> str:
-        result = self.root
-        for part in self.parts:
-            match part:
-                case AttributePart(name):
-                    result += f".{name}"
-                case ItemPart(key):
-                    if isinstance(key, tuple):
-                        result += f"[{','.join(key)}]"
-                    else:
-                        result += f"[{key}]"
-                case _:
-                    msg = f"Unknown part type: {type(part)}"
-                    raise TypeError(msg)
-        return result
+        return self.root + "".join(map(_format_part, self.parts))
 
     @classmethod
     def parse(cls, path_str: str) -> Self:
@@ -110,6 +120,7 @@ class ModelPath(Path):
         if self.root != self.ROOT_SYMBOL:
             msg = f"ModelPath root must be '{self.ROOT_SYMBOL}'. Got: {self.root}"
             raise ValueError(msg)
+        object.__setattr__(self, "root", _intern(self.root))
 
 
 @dataclass(slots=True, frozen=True)
@@ -123,6 +134,7 @@ class CalcPath(Path):
         if not self.root.startswith(self.PREFIX):
             msg = f"CalcPath root must start with '{self.PREFIX}'. Got: {self.root}"
             raise ValueError(msg)
+        object.__setattr__(self, "root", _intern(self.root))
 
     @property
     def calc_name(self) -> str:
@@ -140,6 +152,7 @@ class VerificationPath(Path):
         if not self.root.startswith(self.PREFIX):
             msg = f"VerificationPath root must start with '{self.PREFIX}'. Got: {self.root}"
             raise ValueError(msg)
+        object.__setattr__(self, "root", _intern(self.root))
         # Parts are now allowed for Table[K, bool] verifications
         # where parts represent the table item access (e.g., ?verify[key])
 
@@ -164,6 +177,20 @@ def parse_path(path_str: str) -> ModelPath | CalcPath | VerificationPath:
 class ProjectPath:
     scope: str
     path: ModelPath | CalcPath | VerificationPath
+    # ProjectPaths key every value table of the evaluation engine; hashing the nested
+    # path structure on each lookup is avoided by computing the hash once
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "scope", _intern(self.scope))
+        object.__setattr__(self, "_hash", hash((self.scope, self.path)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple[type[Self], tuple[str, ModelPath | CalcPath | VerificationPath]]:
+        # String hashes differ between processes: recompute the hash when unpickling
+        return (type(self), (self.scope, self.path))
 
     def __str__(self) -> str:
         return f"{self.scope}::{self.path}"
@@ -283,6 +310,26 @@ def iter_leaf_path_parts(  # noqa: PLR0912, C901
         )
 
 
+# Bounded so that dynamically created model classes (`create_model`, per-test classes) can still be collected
+@lru_cache(maxsize=1024)
+def _leaf_path_parts_cached(model: Any) -> tuple[tuple[PartBase, ...], ...]:
+    return tuple(iter_leaf_path_parts(model))
+
+
+def leaf_path_parts(model: Any) -> tuple[tuple[PartBase, ...], ...]:
+    """Return the leaf path parts of a type, memoized per type.
+
+    Same as `tuple(iter_leaf_path_parts(model))`, but the result for a hashable
+    type is computed only once, as the evaluation engine asks for the same types
+    over and over. Unhashable annotations are walked on every call.
+    """
+    try:
+        hash(model)
+    except TypeError:
+        return tuple(iter_leaf_path_parts(model))
+    return _leaf_path_parts_cached(model)
+
+
 def get_value_by_parts(data: BaseModel, parts: tuple[PartBase, ...]) -> Any:
     current: Any = data
     for part in parts:
@@ -358,7 +358,7 @@ def _expand_verification_names(verification: Verification[Any, ...]) -> list[str
                 # Generate all combinations
                 all_values = [list(enum_type) for enum_type in enum_types]
                 for combo in itertools.product(*all_values):
-                    key_str = ",".join(m.value for m in combo)
+                    key_str = ",".join([m.value for m in combo])
                     names.append(f"{base_name}[{key_str}]")
 
     # If we couldn't expand the keys (unknown key type), fall back to base name
@@ -121,3 +121,40 @@ class Phase(StrEnum):
 def test_table[T](type_: type[T], expected: T) -> None:
     default_val = default(type_)
     assert default_val == expected
+
+
+@pytest.mark.parametrize(
+    "type_",
+    [
+        list[int],
+        int | None,
+        Annotated[int, "meta"],
+        object,
+    ],
+)
+def test_no_default_raises_value_error(type_: object) -> None:
+    with pytest.raises(ValueError, match="No default value defined"):
+        default(type_)  # ty: ignore[invalid-argument-type]
+
+
+def test_custom_default_method() -> None:
+    class Counter:
+        calls = 0
+
+        @classmethod
+        def default(cls) -> int:
+            cls.calls += 1
+            return cls.calls
+
+    # The custom method is resolved once per class but called on every `default()` call
+    assert default(Counter) == 1
+    assert default(Counter) == 2
+
+
+def test_custom_default_method_with_arguments_raises_type_error() -> None:
+    class NeedsArgs:
+        def default(self) -> int:
+            return 0
+
+    with pytest.raises(TypeError, match="Failed to call default method"):
+        default(NeedsArgs)
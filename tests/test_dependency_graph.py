@@ -55,6 +55,11 @@ def test_topological_sort_longer_cycle() -> None:
         topological_sort({"a": ["b"], "b": ["c"], "c": ["a"]})
 
 
+def test_topological_sort_cycle_error_names_the_cycle() -> None:
+    with pytest.raises(ValueError, match="a -> b -> c -> a"):
+        topological_sort({"a": ["b"], "b": ["c"], "c": ["a"]})
+
+
 def test_topological_sort_works_with_integers() -> None:
     result = topological_sort({1: [2], 2: [3], 3: []})
     assert result == [1, 2, 3]
@@ -133,6 +133,91 @@ def test_evaluate_graph_chained_calculations() -> None:
     assert result.get_value(triple_path) == 30.0
 
 
+def test_evaluate_graph_reuses_spec_across_evaluations() -> None:
+    """Test that evaluating the same GraphSpec repeatedly uses each call's own inputs."""
+    project = vq.Project(name="TestProject")
+    scope = vq.Scope(name="TestScope")
+    project.add_scope(scope)
+
+    @scope.root_model()
+    class TestModel(BaseModel):
+        x: float
+
+    @scope.calculation()
+    def double_x(x: Annotated[float, vq.Ref("$.x")]) -> float:
+        return x * 2
+
+    spec = build_graph_spec(project)
+    x_path = ProjectPath(
+        scope="TestScope",
+        path=ModelPath(root="$", parts=(AttributePart("x"),)),
+    )
+    double_path = ProjectPath(
+        scope="TestScope",
+        path=CalcPath(root="@double_x", parts=()),
+    )
+
+    first = evaluate_graph(spec, {x_path: 1.0})
+    second = evaluate_graph(spec, {x_path: 4.0})
+
+    assert first.get_value(double_path) == 2.0
+    assert second.get_value(double_path) == 8.0
+
+
+def test_evaluate_graph_with_workers_matches_sequential() -> None:
+    """Test that concurrent evaluation gives the same results as sequential evaluation."""
+    project = vq.Project(name="TestProject")
+    scope = vq.Scope(name="TestScope")
+    project.add_scope(scope)
+
+    @scope.root_model()
+    class TestModel(BaseModel):
+        x: float
+
+    @scope.calculation()
+    def double_x(x: Annotated[float, vq.Ref("$.x")]) -> float:
+        return x * 2
+
+    @scope.calculation()
+    def triple_x(x: Annotated[float, vq.Ref("$.x")]) -> float:
+        return x * 3
+
+    @scope.calculation()
+    def sum_both(
+        doubled: Annotated[float, vq.Ref("@double_x")],
+        tripled: Annotated[float, vq.Ref("@triple_x")],
+    ) -> float:
+        return doubled + tripled
+
+    spec = build_graph_spec(project)
+    initial_values = {
+        ProjectPath(
+            scope="TestScope",
+            path=ModelPath(root="$", parts=(AttributePart("x"),)),
+        ): 2.0,
+    }
+
+    sequential = evaluate_graph(spec, initial_values)
+    concurrent = evaluate_graph(spec, initial_values, max_workers=4)
+
+    assert concurrent.success
+    assert dict(concurrent.iter_leaf_values()) == dict(sequential.iter_leaf_values())
+    sum_path = ProjectPath(
+        scope="TestScope",
+        path=CalcPath(root="@sum_both", parts=()),
+    )
+    assert concurrent.get_value(sum_path) == 10.0
+
+
+def test_evaluate_graph_rejects_non_positive_workers() -> None:
+    """Test that max_workers must be at least 1."""
+    project = vq.Project(name="TestProject")
+    spec = build_graph_spec(project)
+
+    with pytest.raises(ValueError, match="max_workers"):
+        evaluate_graph(spec, {}, max_workers=0)
+
+
 def test_evaluate_graph_verification() -> None:
     """Test evaluating a verification."""
     project = vq.Project(name="TestProject")
@@ -306,6 +391,79 @@ def test_evaluate_graph_missing_initial_value_error() -> None:
     assert len(result.errors) > 0
 
 
+def test_evaluate_graph_calls_each_function_once() -> None:
+    """Test that a function with several output leaves is called (and reported) once."""
+    project = vq.Project(name="TestProject")
+    scope = vq.Scope(name="TestScope")
+    project.add_scope(scope)
+
+    @scope.root_model()
+    class TestModel(BaseModel):
+        x: float
+
+    class Output(BaseModel):
+        a: float
+        b: float
+
+    calls: list[float] = []
+
+    @scope.calculation()
+    def split_x(x: Annotated[float, vq.Ref("$.x")]) -> Output:
+        calls.append(x)
+        if x < 0:
+            msg = "x must be non-negative"
+            raise ValueError(msg)
+        return Output(a=x, b=-x)
+
+    spec = build_graph_spec(project)
+    x_path = ProjectPath(
+        scope="TestScope",
+        path=ModelPath(root="$", parts=(AttributePart("x"),)),
+    )
+
+    result = evaluate_graph(spec, {x_path: 2.0})
+    assert result.success
+    assert calls == [2.0]
+
+    calls.clear()
+    result = evaluate_graph(spec, {x_path: -1.0})
+    assert calls == [-1.0]
+    assert len(result.errors) == 1
+    assert "x must be non-negative" in result.errors[0][1]
+
+
+def test_evaluate_graph_reports_all_missing_dependencies() -> None:
+    """Test that a function's missing dependency values are reported together."""
+    project = vq.Project(name="TestProject")
+    scope = vq.Scope(name="TestScope")
+    project.add_scope(scope)
+
+    @scope.root_model()
+    class TestModel(BaseModel):
+        x: float
+        y: float
+
+    @scope.calculation()
+    def add(
+        x: Annotated[float, vq.Ref("$.x")],
+        y: Annotated[float, vq.Ref("$.y")],
+    ) -> float:
+        return x + y
+
+    spec = build_graph_spec(project)
+
+    result = evaluate_graph(spec, {})
+
+    calc_path = ProjectPath(
+        scope="TestScope",
+        path=CalcPath(root="@add", parts=()),
+    )
+    calc_errors = [message for path, message in result.errors if path == calc_path]
+    assert len(calc_errors) == 1
+    assert "$.x" in calc_errors[0]
+    assert "$.y" in calc_errors[0]
+
+
 def test_evaluate_graph_calculation_output_with_model() -> None:
     """Test calculation that returns a Pydantic model."""
     project = vq.Project(name="TestProject")
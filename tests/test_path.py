@@ -1,5 +1,6 @@
 """Tests for path parsing and navigation logic in veriq._path."""
 
+import pickle
 from enum import StrEnum, unique
 from typing import Any
 
@@ -19,6 +20,7 @@ from veriq._path import (
     get_value_by_parts,
     hydrate_value_by_leaf_values,
     iter_leaf_path_parts,
+    leaf_path_parts,
     parse_path,
 )
 
@@ -294,6 +296,29 @@ class TestProjectPath:
         ppath = ProjectPath(scope="Power", path=ModelPath.parse("$.field"))
         assert str(ppath) == "Power::$.field"
 
+    def test_equal_project_paths_hash_equal(self):
+        a = ProjectPath(scope="Power", path=ModelPath.parse("$.field[0]"))
+        b = ProjectPath(scope="Power", path=ModelPath.parse("$.field[0]"))
+        assert a == b
+        assert hash(a) == hash(b)
+        assert {a: 1}[b] == 1
+
+    def test_project_path_pickle_roundtrip(self):
+        ppath = ProjectPath(scope="Power", path=CalcPath.parse("@calc.out"))
+        restored = pickle.loads(pickle.dumps(ppath))  # noqa: S301
+        assert restored == ppath
+        assert hash(restored) == hash(ppath)
+
+
+class TestPathInterning:
+    def test_equal_roots_and_scopes_are_identical(self):
+        # Build the strings at runtime so that they are distinct objects before interning
+        name = "power"
+        a = ProjectPath(scope=name.capitalize(), path=CalcPath(root=f"@{name}", parts=()))
+        b = ProjectPath(scope="Power", path=CalcPath(root="@power", parts=()))
+        assert a.scope is b.scope
+        assert a.path.root is b.path.root
+
 
 # --- get_value_by_parts() Tests ---
 
@@ -382,6 +407,18 @@ class TestIterLeafPathParts:
         assert (ItemPart(("blue", "large")),) in parts
 
 
+class TestLeafPathParts:
+    @pytest.mark.parametrize(
+        "model",
+        [float, InnerModel, OuterModel, vq.Table[Color, float], vq.Table[tuple[Color, Size], float]],
+    )
+    def test_matches_iter_leaf_path_parts(self, model: Any):
+        assert leaf_path_parts(model) == tuple(iter_leaf_path_parts(model))
+
+    def test_result_is_cached_per_type(self):
+        assert leaf_path_parts(OuterModel) is leaf_path_parts(OuterModel)
+
+
 # --- hydrate_value_by_leaf_values() Tests ---
 
 
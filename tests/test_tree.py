@@ -151,6 +151,34 @@ class TestScopeTree:
         assert len(nodes) == 1
         assert calc_node in nodes
 
+    def test_iter_leaves(self):
+        x_node = PathNode(
+            path=ProjectPath(scope="Power", path=ModelPath(root="$", parts=(AttributePart("x"),))),
+            value=1.0,
+        )
+        y_node = PathNode(
+            path=ProjectPath(scope="Power", path=ModelPath(root="$", parts=(AttributePart("y"),))),
+            value=2.0,
+        )
+        model_node = PathNode(
+            path=ProjectPath(scope="Power", path=ModelPath(root="$", parts=())),
+            children=(x_node, y_node),
+        )
+        calc_node = PathNode(path=ProjectPath(scope="Power", path=CalcPath(root="@calc1", parts=())), value=3.0)
+        verif_node = PathNode(
+            path=ProjectPath(scope="Power", path=VerificationPath(root="?verif1", parts=())),
+            value=True,
+        )
+
+        tree = ScopeTree(
+            scope_name="Power",
+            model=model_node,
+            calculations=(calc_node,),
+            verifications=(verif_node,),
+        )
+
+        assert list(tree.iter_leaves()) == [x_node, y_node, calc_node, verif_node]
+
 
 class TestBuildScopeTrees:
     def test_empty_values(self):
@@ -365,3 +393,27 @@ class TestBuildScopeTrees:
         assert tree.model is not None
         leaves = list(tree.model.iter_leaves())
         assert len(leaves) == 2
+
+    def test_children_are_sorted_attributes_before_items(self):
+        def model_path(*parts: AttributePart | ItemPart) -> ProjectPath:
+            return ProjectPath(scope="Test", path=ModelPath(root="$", parts=parts))
+
+        values = {
+            model_path(ItemPart("b")): 1.0,
+            model_path(AttributePart("z"), AttributePart("y")): 2.0,
+            model_path(ItemPart("a")): 3.0,
+            model_path(AttributePart("z"), AttributePart("x")): 4.0,
+            model_path(AttributePart("c")): 5.0,
+        }
+
+        result = build_scope_trees(values)
+
+        model = result["Test"].model
+        assert model is not None
+        assert [child.path.path.parts[-1] for child in model.children] == [
+            AttributePart("c"),
+            AttributePart("z"),
+            ItemPart("a"),
+            ItemPart("b"),
+        ]
+        assert [leaf.value for leaf in model.iter_leaves()] == [5.0, 4.0, 2.0, 3.0, 1.0]
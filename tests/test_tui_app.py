@@ -767,6 +767,17 @@ class TestTableEditor:
                 assert editor._format_value(10.5) == "10.5"
                 assert editor._format_value(None) == ""
                 assert editor._format_value("test") == "test"
+
+                # Type-specialised formatters agree with the generic one
+                fmt_float = editor._make_formatter(float)
+                assert fmt_float(10.0) == "10"
+                assert fmt_float(10.5) == "10.5"
+                assert fmt_float(3) == "3"
+                assert fmt_float(None) == ""
+                fmt_int = editor._make_formatter(int)
+                assert fmt_int(42) == "42"
+                assert fmt_int(None) == ""
+                assert editor._fmt is fmt_float  # power is Table[Mode, float]
         finally:
             toml_path.unlink()
 
@@ -1170,3 +1181,57 @@ class TestSwitchBetween3DTables:
 
         finally:
             toml_path.unlink()
+
+    async def test_change_dimension_updates_cells_in_place(self):
+        """Test that changing the fixed dimension rewrites cell values without rebuilding rows."""
+        from textual.coordinate import Coordinate
+
+        project = create_project_with_3d_tables()
+        toml_data = {
+            "Scope3D": {
+                "model": {
+                    "table_a": {
+                        "cpu,nominal,initial": 1.0,
+                        "cpu,nominal,cruise": 2.0,
+                        "cpu,safe,initial": 3.0,
+                        "cpu,safe,cruise": 4.0,
+                        "radio,nominal,initial": 5.0,
+                        "radio,nominal,cruise": 6.0,
+                        "radio,safe,initial": 7.0,
+                        "radio,safe,cruise": 8.0,
+                    },
+                    "table_b": {
+                        "cpu,nominal,initial": 10,
+                        "cpu,nominal,cruise": 20,
+                        "cpu,safe,initial": 30,
+                        "cpu,safe,cruise": 40,
+                        "radio,nominal,initial": 50,
+                        "radio,nominal,cruise": 60,
+                        "radio,safe,initial": 70,
+                        "radio,safe,cruise": 80,
+                    },
+                },
+            },
+        }
+        toml_path = create_toml_file(toml_data)
+
+        try:
+            app = VeriqEditApp(toml_path, project)
+            async with app.run_test(size=(120, 40)) as pilot:
+                # Let the startup Select.Changed messages settle before changing the slice
+                await pilot.pause()
+                editor = app.query_one("#editor-Scope3D", TableEditor)
+                row_keys = list(editor.rows)
+                assert editor.get_cell_at(Coordinate(0, 1)) == "1"
+
+                editor.update_slice({0: Component.RADIO})
+                await pilot.pause()
+
+                assert editor.fixed_dims == {0: Component.RADIO}
+                assert list(editor.rows) == row_keys
+                assert editor.get_cell_at(Coordinate(0, 0)) == "nominal"
+                assert editor.get_cell_at(Coordinate(0, 1)) == "5"
+                assert editor.get_cell_at(Coordinate(1, 2)) == "8"
+
+        finally:
+            toml_path.unlink()
@@ -173,6 +173,51 @@ class TestTableData:
         fixed_dims = {0: Component.RADIO}
         assert table_data.get_cell(fixed_dims, "nominal", "initial") == 20.0
 
+    def test_get_slice_matrix_1d(self):
+        """Test getting the full grid for 1D table."""
+        table_data = TableData(
+            field_name="power",
+            key_types=(Mode,),
+            value_type=float,
+            flat_data={"nominal": 10.0},
+        )
+        assert table_data.get_slice_matrix({}) == [[10.0], [None]]
+
+    def test_get_slice_matrix_2d(self):
+        """Test getting the full grid for 2D table."""
+        table_data = TableData(
+            field_name="power",
+            key_types=(Mode, Phase),
+            value_type=float,
+            flat_data={
+                "nominal,initial": 10.0,
+                "nominal,cruise": 15.0,
+                "safe,initial": 5.0,
+                "safe,cruise": 7.0,
+            },
+        )
+        assert table_data.get_slice_matrix({}) == [[10.0, 15.0], [5.0, 7.0]]
+
+    def test_get_slice_matrix_3d_matches_get_cell(self):
+        """Test that the full grid matches per-cell lookups for 3D table."""
+        table_data = TableData(
+            field_name="power",
+            key_types=(Component, Mode, Phase),
+            value_type=float,
+            flat_data={
+                "cpu,nominal,initial": 10.0,
+                "cpu,safe,cruise": 7.0,
+                "radio,nominal,initial": 20.0,
+            },
+        )
+        for fixed_dims in ({0: Component.CPU}, {0: Component.RADIO}, {0: Component.SENSOR}):
+            expected = [
+                [table_data.get_cell(fixed_dims, row, col) for col in table_data.column_labels(fixed_dims)]
+                for row in table_data.row_labels(fixed_dims)
+            ]
+            assert table_data.get_slice_matrix(fixed_dims) == expected
+        assert table_data.get_slice_matrix({0: Component.RADIO})[0][0] == 20.0
+
     def test_update_cell_2d(self):
         """Test updating cell value for 2D table."""
         table_data = TableData(